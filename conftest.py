@@ -1,8 +1,13 @@
-# Copyright (C) 2020  The Software Heritage developers
+# Copyright (C) 2020-2024  The Software Heritage developers
 # See the AUTHORS file at the top-level directory of this distribution
 # License: GNU General Public License version 3, or any later version
 # See top-level LICENSE file for more information
 
+import os
+import shutil
+import tempfile
+from typing import Optional
+
 import pytest
 
 pytest_plugins = [
@@ -12,6 +17,51 @@ pytest_plugins = [
 ]
 
 
+# free space required to put test temporary files in /dev/shm, pytest keeps the
+# temporary directories of the last three runs
+TMPFS_MIN_FREE_SPACE = 1024 * 1024 * 1024
+
+
+# tempfile default directory before pytest_configure redirected it
+_saved_tempdir_key = pytest.StashKey[Optional[str]]()
+
+
+def pytest_configure(config):
+    """Move the pytest temporary directories to a tmpfs when available.
+
+    Tests are mostly I/O bound (archives extraction, svn working copies, dumps...)
+    so running them in RAM saves a lot of time. ``/dev/shm`` is only used when it
+    has at least :data:`TMPFS_MIN_FREE_SPACE` bytes free (it is as small as 64MiB
+    in default docker containers). The tmpfs root can be overridden with the
+    ``SWH_TEST_TMPDIR`` environment variable (set it empty to disable)
+    and the ``--basetemp`` option always takes precedence. Temporary files created
+    by the code under test with :mod:`tempfile` defaults, as svn exports, also
+    go to that tmpfs.
+
+    """
+    if config.option.basetemp is not None and not hasattr(config, "workerinput"):
+        # explicitly set by user, pytest-xdist sets it for its workers which
+        # still need the redirection for temporary files of the code under test
+        return
+    tmp_root = os.environ.get("SWH_TEST_TMPDIR")
+    if (
+        tmp_root is None
+        and os.access("/dev/shm", os.W_OK)
+        and shutil.disk_usage("/dev/shm").free >= TMPFS_MIN_FREE_SPACE
+    ):
+        tmp_root = "/dev/shm"
+    if tmp_root:
+        # pytest creates its numbered base temporary directories under
+        # tempfile.gettempdir()
+        config.stash[_saved_tempdir_key] = tempfile.tempdir
+        tempfile.tempdir = tmp_root
+
+
+def pytest_unconfigure(config):
+    if _saved_tempdir_key in config.stash:
+        tempfile.tempdir = config.stash[_saved_tempdir_key]
+
+
 @pytest.fixture(scope="session")
 def swh_scheduler_celery_includes(swh_scheduler_celery_includes):
     return swh_scheduler_celery_includes + [
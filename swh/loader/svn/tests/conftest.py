@@ -4,6 +4,7 @@
 # See top-level LICENSE file for more information
 
 from contextlib import closing
+import os
 import socket
 import subprocess
 import time
@@ -15,21 +16,42 @@ import pytest
 from swh.loader.svn.loader import SvnLoader, SvnLoaderFromRemoteDump
 from swh.scheduler.model import Lister
 
-from .utils import create_repo
+from .utils import (
+    commit_session,
+    copy_repo,
+    create_repo,
+    prepare_cached_repository_from_archive,
+)
 
 NAMESPACE = "swh.loader.svn"
 
 
+def pytest_collection_modifyitems(items):
+    """Group tests by the archive they load so that, when distributing them with
+    ``pytest -n auto --dist loadgroup``, the tests of an archive run on the same
+    pytest-xdist worker and reuse its extraction cache."""
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None and "svn_repo_url" in callspec.params:
+            item.add_marker(
+                pytest.mark.xdist_group(name=callspec.params["svn_repo_url"])
+            )
+
+
 @pytest.fixture(params=[SvnLoader, SvnLoaderFromRemoteDump])
 def svn_loader_cls(request):
     return request.param
 
 
-@pytest.fixture
-def swh_storage_backend_config(swh_storage_backend_config):
-    """Basic pg storage configuration with no journal collaborator
+@pytest.fixture(scope="module")
+def swh_storage_backend_config():
+    """Basic in-memory storage configuration with no journal collaborator
     (to avoid pulling optional dependency on clients of this fixture)
 
+    Tests only read back what they loaded so they do not need the round-trips
+    to a PostgreSQL database. As each storage instance is created from that
+    configuration by the ``swh_storage`` fixture, it can be shared by a module.
+
     """
     return {
         "cls": "filter",
@@ -42,7 +64,7 @@ def swh_storage_backend_config(swh_storage_backend_config):
                 "revision": 10,
                 "release": 100,
             },
-            "storage": swh_storage_backend_config,
+            "storage": {"cls": "memory"},
         },
     }
 
@@ -56,10 +78,55 @@ def swh_loader_config(swh_storage_backend_config) -> Dict[str, Any]:
     }
 
 
+@pytest.fixture(scope="session")
+def empty_repo_template(tmp_path_factory):
+    """Path of an empty repository created once and copied by the fixtures
+    providing empty repositories to tests."""
+    template_dir = tmp_path_factory.mktemp("repo-template")
+    create_repo(template_dir)
+    return os.path.join(template_dir, "tmprepo")
+
+
 @pytest.fixture
-def repo_url(tmpdir_factory):
+def repo_url(tmpdir_factory, empty_repo_template):
     # create a repository
-    return create_repo(tmpdir_factory.mktemp("repos"))
+    return copy_repo(empty_repo_template, tmpdir_factory.mktemp("repos"))
+
+
+@pytest.fixture(scope="session")
+def svn_archives_cache_dir(tmp_path_factory):
+    """Directory holding test archives extracted on first use by
+    prepare_repository, one per pytest-xdist worker as each worker gets its own
+    base temporary directory."""
+    return str(tmp_path_factory.mktemp("svn-archives"))
+
+
+@pytest.fixture(scope="session")
+def prepare_repository(svn_archives_cache_dir):
+    """Drop-in replacement for :func:`swh.loader.tests.prepare_repository_from_archive`
+    extracting each archive only once per test session."""
+
+    def _prepare_repository(archive_path, filename=None, tmp_path="/tmp"):
+        return prepare_cached_repository_from_archive(
+            archive_path, filename, tmp_path, svn_archives_cache_dir
+        )
+
+    return _prepare_repository
+
+
+@pytest.fixture
+def svn_repo_url(request, datadir, tmp_path, prepare_repository):
+    """URL of a repository extracted from a test archive, whose name must be
+    provided by indirect parametrization."""
+    archive_path = os.path.join(datadir, f"{request.param}.tgz")
+    return prepare_repository(archive_path, tmp_path=tmp_path)
+
+
+@pytest.fixture(autouse=True)
+def add_commit_session():
+    """Connections opened by add_commit during a test are released at its end."""
+    with commit_session() as session:
+        yield session
 
 
 @pytest.fixture(autouse=True)
@@ -3,8 +3,6 @@
 # License: GNU General Public License version 3, or any later version
 # See top-level LICENSE file for more information
 
-import os
-
 import pytest
 
 from swh.loader.core.nar import Nar
@@ -14,7 +12,6 @@ from swh.loader.tests import (
     assert_last_visit_matches,
     fetch_extids_from_checksums,
     get_stats,
-    prepare_repository_from_archive,
 )
 
 
@@ -28,19 +25,15 @@ def compute_nar_hash_for_rev(repo_url: str, rev: int, hash_name: str = "sha256")
     return nar.hexdigest()[hash_name]
 
 
-def test_loader_svn_directory(swh_storage, datadir, tmp_path):
+@pytest.mark.parametrize("svn_repo_url", ["pkg-gourmet"], indirect=True)
+def test_loader_svn_directory(swh_storage, svn_repo_url):
     """Loading a svn tree with proper nar checksums should be eventful"""
-    archive_name = "pkg-gourmet"
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_url = prepare_repository_from_archive(
-        archive_path, archive_name, tmp_path=tmp_path
-    )
     svn_revision = 5
-    checksums = {"sha256": compute_nar_hash_for_rev(repo_url, svn_revision)}
+    checksums = {"sha256": compute_nar_hash_for_rev(svn_repo_url, svn_revision)}
 
     loader = SvnExportLoader(
         swh_storage,
-        repo_url,
+        svn_repo_url,
         ref=svn_revision,
         checksum_layout="nar",
         checksums=checksums,
@@ -52,7 +45,7 @@ def test_loader_svn_directory(swh_storage, datadir, tmp_path):
 
     actual_visit = assert_last_visit_matches(
         swh_storage,
-        repo_url,
+        svn_repo_url,
         status="full",
         type="svn-export",
     )
@@ -87,7 +80,7 @@ def test_loader_svn_directory(swh_storage, datadir, tmp_path):
     # Another run on the same svn directory should be uneventful
     loader2 = SvnExportLoader(
         swh_storage,
-        repo_url,
+        svn_repo_url,
         ref=svn_revision,
         checksum_layout="nar",
         checksums=checksums,
@@ -101,15 +94,11 @@ def test_loader_svn_directory(swh_storage, datadir, tmp_path):
     [False, True],
     ids=["origin_url == svn_url", "origin_url != svn_url"],
 )
+@pytest.mark.parametrize("svn_repo_url", ["pkg-gourmet"], indirect=True)
 def test_loader_svn_directory_sub_paths(
-    swh_storage, datadir, tmp_path, use_custom_origin_url
+    swh_storage, use_custom_origin_url, svn_repo_url
 ):
     """Loading a subset of a svn tree with proper nar checksums should be eventful"""
-    archive_name = "pkg-gourmet"
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_url = prepare_repository_from_archive(
-        archive_path, archive_name, tmp_path=tmp_path
-    )
     svn_paths = ["gourmet/trunk/debian/gourmet.1", "gourmet/trunk/debian/patches"]
     svn_revision = 5
     checksum_layout = "nar"
@@ -118,11 +107,11 @@ def test_loader_svn_directory_sub_paths(
     }
 
     origin_url = (
-        f"{repo_url}?nar=sha256-{checksums['sha256']}"
+        f"{svn_repo_url}?nar=sha256-{checksums['sha256']}"
         if use_custom_origin_url
-        else repo_url
+        else svn_repo_url
     )
-    svn_url = repo_url if use_custom_origin_url else None
+    svn_url = svn_repo_url if use_custom_origin_url else None
 
     loader = SvnExportLoader(
         swh_storage,
@@ -186,19 +175,15 @@ def test_loader_svn_directory_sub_paths(
     assert actual_result2 == {"status": "uneventful"}
 
 
-def test_loader_svn_directory_hash_mismatch(swh_storage, datadir, tmp_path):
+@pytest.mark.parametrize("svn_repo_url", ["pkg-gourmet"], indirect=True)
+def test_loader_svn_directory_hash_mismatch(swh_storage, svn_repo_url):
     """Loading a svn tree with faulty checksums should fail"""
-    archive_name = "pkg-gourmet"
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_url = prepare_repository_from_archive(
-        archive_path, archive_name, tmp_path=tmp_path
-    )
     faulty_checksums = {
         "sha256": "00000ed1855beadfa9c00f730242f5efe3e4612e76f0dcc45215c4a3234c7466"
     }
     loader = SvnExportLoader(
         swh_storage,
-        repo_url,
+        svn_repo_url,
         ref=5,
         checksum_layout="nar",
         checksums=faulty_checksums,
@@ -11,13 +11,13 @@ from swh.loader.svn.loader import SvnLoader, SvnLoaderFromRemoteDump
 from swh.loader.svn.utils import ExternalDefinition, svn_urljoin
 from swh.loader.tests import assert_last_visit_matches, check_snapshot
 
-from .utils import CommitChange, CommitChangeType, add_commit, create_repo
+from .utils import CommitChange, CommitChangeType, add_commit, copy_repo, create_repo
 
 
 @pytest.fixture
-def external_repo_url(tmpdir_factory):
+def external_repo_url(tmpdir_factory, empty_repo_template):
     # create a repository
-    return create_repo(tmpdir_factory.mktemp("external"))
+    return copy_repo(empty_repo_template, tmpdir_factory.mktemp("external"))
 
 
 def test_loader_with_valid_svn_externals(
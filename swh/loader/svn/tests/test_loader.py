@@ -3,13 +3,14 @@
 # License: GNU General Public License version 3, or any later version
 # See top-level LICENSE file for more information
 
+import gzip
 import itertools
 import logging
 import os
 import shutil
 import subprocess
 import textwrap
-from typing import Any, Dict
+from typing import Any, Dict, NamedTuple
 
 import pytest
 from subvertpy import SubversionException
@@ -21,17 +22,17 @@ from swh.loader.svn.loader import (
 )
 from swh.loader.svn.svn_repo import SvnRepo
 from swh.loader.svn.utils import init_svn_repo_from_dump
-from swh.loader.tests import (
-    assert_last_visit_matches,
-    check_snapshot,
-    get_stats,
-    prepare_repository_from_archive,
-)
+from swh.loader.tests import assert_last_visit_matches, check_snapshot, get_stats
 from swh.model.from_disk import DentryPerms, Directory
 from swh.model.hashutil import hash_to_bytes
-from swh.model.model import Snapshot, SnapshotBranch, SnapshotTargetType
+from swh.model.model import (
+    OriginVisitStatus,
+    Snapshot,
+    SnapshotBranch,
+    SnapshotTargetType,
+)
 
-from .utils import CommitChange, CommitChangeType, add_commit
+from .utils import CommitChange, CommitChangeType, add_commit, link_or_copy
 
 GOURMET_SNAPSHOT = Snapshot(
     id=hash_to_bytes("889cacc2731e3312abfb2b1a0c18ade82a949e07"),
@@ -43,6 +44,11 @@ GOURMET_SNAPSHOT = Snapshot(
     },
 )
 
+# revision of the pkg-gourmet repository incremental visits start from
+GOURMET_START_REVISION_ID = hash_to_bytes("95edacc8848369d6fb1608e887d6d2474fd5224f")
+
+GOURMET_TAMPERED_SNAPSHOT_ID = hash_to_bytes("5aa61959e788e281fd6e187053d0f46c68e8d8bb")
+
 GOURMET_UPDATES_SNAPSHOT = Snapshot(
     id=hash_to_bytes("11086d15317014e43d2438b7ffc712c44f1b8afe"),
     branches={
@@ -53,6 +59,75 @@ GOURMET_UPDATES_SNAPSHOT = Snapshot(
     },
 )
 
+MEDIAWIKI_SNAPSHOT = Snapshot(
+    id=hash_to_bytes("d6d6e9703f157c5702d9a4a5dec878926ed4ab76"),
+    branches={
+        b"HEAD": SnapshotBranch(
+            target=hash_to_bytes("7da4975c363101b819756d33459f30a866d01b1b"),
+            target_type=SnapshotTargetType.REVISION,
+        )
+    },
+)
+
+PYANG_SNAPSHOT = Snapshot(
+    id=hash_to_bytes("6d9590de11b00a5801de0ff3297c5b44bbbf7d24"),
+    branches={
+        b"HEAD": SnapshotBranch(
+            target=hash_to_bytes("9c6962eeb9164a636c374be700672355e34a98a7"),
+            target_type=SnapshotTargetType.REVISION,
+        )
+    },
+)
+
+GOURMET_EDGE_CASES_SNAPSHOT = Snapshot(
+    id=hash_to_bytes("18e60982fe521a2546ab8c3c73a535d80462d9d0"),
+    branches={
+        b"HEAD": SnapshotBranch(
+            target=hash_to_bytes("3f43af2578fccf18b0d4198e48563da7929dc608"),
+            target_type=SnapshotTargetType.REVISION,
+        )
+    },
+)
+
+GOURMET_WRONG_LINKS_SNAPSHOT = Snapshot(
+    id=hash_to_bytes("b17f38acabb90f066dedd30c29f01a02af88a5c4"),
+    branches={
+        b"HEAD": SnapshotBranch(
+            target=hash_to_bytes("cf30d3bb9d5967d0a2bbeacc405f10a5dd9b138a"),
+            target_type=SnapshotTargetType.REVISION,
+        )
+    },
+)
+
+HTTTHTTT_SNAPSHOT = Snapshot(
+    id=hash_to_bytes("70487267f682c07e52a2371061369b6cf5bffa47"),
+    branches={
+        b"HEAD": SnapshotBranch(
+            target=hash_to_bytes("604a17dbb15e8d7ecb3e9f3768d09bf493667a93"),
+            target_type=SnapshotTargetType.REVISION,
+        )
+    },
+)
+
+
+class LoadState(NamedTuple):
+    last_visit: OriginVisitStatus
+    stats: Dict[str, int]
+
+
+def _load_state(storage, origin_url: str, snapshot: Snapshot) -> LoadState:
+    """Check the last visit of an origin is full and targets a snapshot consistent
+    in storage, then return that visit along with the storage stats."""
+    last_visit = assert_last_visit_matches(
+        storage,
+        origin_url,
+        status="full",
+        type="svn",
+        snapshot=snapshot.id,
+    )
+    check_snapshot(snapshot, storage)
+    return LoadState(last_visit, get_stats(storage))
+
 
 def test_loader_svn_not_found_no_mock(svn_loader_cls, swh_storage, tmp_path):
     """Given an unknown repository, the loader visit ends up in status not_found"""
@@ -152,7 +227,7 @@ def test_loader_svnrdump_no_such_revision(swh_storage, tmp_path, datadir):
     os.mkdir(archive_dump_dir)
     archive_dump = os.path.join(archive_dump_dir, "penguinsdbtools2018.dump.gz")
     # loader now drops the dump as soon as it's mounted so we need to make a copy first
-    shutil.copyfile(archive_ori_dump, archive_dump)
+    link_or_copy(archive_ori_dump, archive_dump)
 
     loading_path = str(tmp_path / "loading")
     os.mkdir(loading_path)
@@ -190,64 +265,33 @@ def test_loader_svnrdump_no_such_revision(swh_storage, tmp_path, datadir):
     assert actual_visit2.snapshot == actual_visit.snapshot
 
 
-def test_loader_svn_new_visit(svn_loader_cls, swh_storage, datadir, tmp_path):
-    """Eventful visit should yield 1 snapshot"""
-    archive_name = "pkg-gourmet"
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
-
-    loader = svn_loader_cls(swh_storage, repo_url, temp_directory=tmp_path)
-
-    assert loader.load() == {"status": "eventful"}
-
-    assert_last_visit_matches(
-        loader.storage,
-        repo_url,
-        status="full",
-        type="svn",
-        snapshot=GOURMET_SNAPSHOT.id,
-    )
-    check_snapshot(loader.snapshot, loader.storage)
-
-    stats = get_stats(loader.storage)
-    assert stats == {
-        "content": 19,
-        "directory": 17,
-        "origin": 1,
-        "origin_visit": 1,
-        "release": 0,
-        "revision": 6,
-        "skipped_content": 0,
-        "snapshot": 1,
-    }
-
-    check_snapshot(GOURMET_SNAPSHOT, loader.storage)
-
-
-def test_loader_svn_2_visits_no_change(svn_loader_cls, swh_storage, datadir, tmp_path):
-    """Visit multiple times a repository with no change should yield the same snapshot"""
-    archive_name = "pkg-gourmet"
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
+@pytest.mark.parametrize("svn_repo_url", ["pkg-gourmet"], indirect=True)
+def test_loader_svn_2_visits_no_change(
+    svn_loader_cls, swh_storage, tmp_path, svn_repo_url, mocker
+):
+    """Visit multiple times a repository with no change should yield the same snapshot
+    without replaying the repository history"""
 
-    loader = svn_loader_cls(swh_storage, repo_url, temp_directory=tmp_path)
+    loader = svn_loader_cls(swh_storage, svn_repo_url, temp_directory=tmp_path)
 
     assert loader.load() == {"status": "eventful"}
     visit_status1 = assert_last_visit_matches(
         loader.storage,
-        repo_url,
+        svn_repo_url,
         status="full",
         type="svn",
         snapshot=GOURMET_SNAPSHOT.id,
     )
     check_snapshot(loader.snapshot, loader.storage)
 
-    loader = svn_loader_cls(swh_storage, repo_url, temp_directory=tmp_path)
+    replay_revisions = mocker.spy(SvnRepo, "swh_hash_data_per_revision")
+
+    loader = svn_loader_cls(swh_storage, svn_repo_url, temp_directory=tmp_path)
 
     assert loader.load() == {"status": "uneventful"}
     visit_status2 = assert_last_visit_matches(
         loader.storage,
-        repo_url,
+        svn_repo_url,
         status="full",
         type="svn",
         snapshot=GOURMET_SNAPSHOT.id,
@@ -257,33 +301,49 @@ def test_loader_svn_2_visits_no_change(svn_loader_cls, swh_storage, datadir, tmp
     assert visit_status1.snapshot == visit_status2.snapshot
 
     stats = get_stats(loader.storage)
-    assert stats["origin_visit"] == 1 + 1  # computed twice the same snapshot
-    assert stats["snapshot"] == 1
-
-    # even starting from previous revision...
-    start_revision = loader.storage.revision_get(
-        [hash_to_bytes("95edacc8848369d6fb1608e887d6d2474fd5224f")]
-    )[0]
-    assert start_revision is not None
+    assert stats == {
+        "content": 19,
+        "directory": 17,
+        "origin": 1,
+        "origin_visit": 1 + 1,  # computed twice the same snapshot
+        "release": 0,
+        "revision": 6,
+        "skipped_content": 0,
+        "snapshot": 1,
+    }
 
-    loader = svn_loader_cls(swh_storage, repo_url, temp_directory=tmp_path)
+    loader = svn_loader_cls(swh_storage, svn_repo_url, temp_directory=tmp_path)
     assert loader.load() == {"status": "uneventful"}
 
     stats = get_stats(loader.storage)
-    assert stats["origin_visit"] == 2 + 1
-    # ... with no change in repository, this yields the same snapshot
-    assert stats["snapshot"] == 1
+    # with no change in repository, a third visit yields the same snapshot
+    assert stats == {
+        "content": 19,
+        "directory": 17,
+        "origin": 1,
+        "origin_visit": 2 + 1,
+        "release": 0,
+        "revision": 6,
+        "skipped_content": 0,
+        "snapshot": 1,
+    }
 
     assert_last_visit_matches(
         loader.storage,
-        repo_url,
+        svn_repo_url,
         status="full",
         type="svn",
         snapshot=GOURMET_SNAPSHOT.id,
     )
 
+    # uneventful visits do not replay any revision
+    replay_revisions.assert_not_called()
+
 
-def test_loader_tampered_repository(svn_loader_cls, swh_storage, datadir, tmp_path):
+@pytest.mark.parametrize("svn_repo_url", ["pkg-gourmet"], indirect=True)
+def test_loader_tampered_repository(
+    svn_loader_cls, swh_storage, datadir, tmp_path, prepare_repository, svn_repo_url
+):
     """In this scenario, the dump has been tampered with to modify the
     commit log [1].  This results in a hash divergence which is
     detected at startup after a new run for the same origin.
@@ -300,67 +360,54 @@ def test_loader_tampered_repository(svn_loader_cls, swh_storage, datadir, tmp_pa
      tar cvf pkg-gourmet-tampered-rev6-log.tgz pkg-gourmet/
     ```
     """
-    archive_name = "pkg-gourmet"
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
 
-    loader = svn_loader_cls(swh_storage, repo_url, temp_directory=tmp_path)
+    loader = svn_loader_cls(swh_storage, svn_repo_url, temp_directory=tmp_path)
     assert loader.load() == {"status": "eventful"}
-    check_snapshot(GOURMET_SNAPSHOT, loader.storage)
-
-    assert_last_visit_matches(
-        loader.storage,
-        repo_url,
-        status="full",
-        type="svn",
-        snapshot=GOURMET_SNAPSHOT.id,
-    )
-    check_snapshot(loader.snapshot, loader.storage)
+    assert loader.snapshot == GOURMET_SNAPSHOT
+    _load_state(loader.storage, svn_repo_url, GOURMET_SNAPSHOT)
 
     archive_path2 = os.path.join(datadir, "pkg-gourmet-tampered-rev6-log.tgz")
-    repo_tampered_url = prepare_repository_from_archive(
-        archive_path2, archive_name, tmp_path
-    )
+    repo_tampered_url = prepare_repository(archive_path2, "pkg-gourmet", tmp_path)
 
     loader2 = svn_loader_cls(
-        swh_storage, repo_tampered_url, origin_url=repo_url, temp_directory=tmp_path
+        swh_storage, repo_tampered_url, origin_url=svn_repo_url, temp_directory=tmp_path
     )
     assert loader2.load() == {"status": "eventful"}
 
     assert_last_visit_matches(
         loader2.storage,
-        repo_url,
+        svn_repo_url,
         status="full",
         type="svn",
-        snapshot=hash_to_bytes("5aa61959e788e281fd6e187053d0f46c68e8d8bb"),
+        snapshot=GOURMET_TAMPERED_SNAPSHOT_ID,
     )
-    check_snapshot(loader.snapshot, loader.storage)
+    check_snapshot(loader2.snapshot, loader2.storage)
 
     stats = get_stats(loader.storage)
-    assert stats["origin"] == 1
-    assert stats["origin_visit"] == 2
-    assert stats["snapshot"] == 2
+    assert {key: stats[key] for key in ("origin", "origin_visit", "snapshot")} == {
+        "origin": 1,
+        "origin_visit": 2,
+        "snapshot": 2,
+    }
 
 
-def test_loader_svn_visit_with_changes(svn_loader_cls, swh_storage, datadir, tmp_path):
+@pytest.mark.parametrize("svn_repo_url", ["pkg-gourmet"], indirect=True)
+def test_loader_svn_visit_with_changes(
+    svn_loader_cls, swh_storage, datadir, tmp_path, prepare_repository, svn_repo_url
+):
     """In this scenario, the repository has been updated with new changes.
     The loading visit should result in new objects stored and 1 new
     snapshot.
 
     """
-    archive_name = "pkg-gourmet"
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_initial_url = prepare_repository_from_archive(
-        archive_path, archive_name, tmp_path
-    )
 
-    # repo_initial_url becomes the origin_url we want to visit some more below
-    loader = svn_loader_cls(swh_storage, repo_initial_url, temp_directory=tmp_path)
+    # svn_repo_url becomes the origin_url we want to visit some more below
+    loader = svn_loader_cls(swh_storage, svn_repo_url, temp_directory=tmp_path)
 
     assert loader.load() == {"status": "eventful"}
     visit_status1 = assert_last_visit_matches(
         loader.storage,
-        repo_initial_url,
+        svn_repo_url,
         status="full",
         type="svn",
         snapshot=GOURMET_SNAPSHOT.id,
@@ -368,31 +415,23 @@ def test_loader_svn_visit_with_changes(svn_loader_cls, swh_storage, datadir, tmp
     check_snapshot(GOURMET_SNAPSHOT, loader.storage)
 
     archive_path = os.path.join(datadir, "pkg-gourmet-with-updates.tgz")
-    repo_updated_url = prepare_repository_from_archive(
-        archive_path, "pkg-gourmet", tmp_path
-    )
+    repo_updated_url = prepare_repository(archive_path, "pkg-gourmet", tmp_path)
 
     loader = svn_loader_cls(
         swh_storage,
         repo_updated_url,
-        origin_url=repo_initial_url,
+        origin_url=svn_repo_url,
         temp_directory=tmp_path,
     )
 
     assert loader.load() == {"status": "eventful"}
-    visit_status2 = assert_last_visit_matches(
-        loader.storage,
-        repo_updated_url,
-        status="full",
-        type="svn",
-        snapshot=GOURMET_UPDATES_SNAPSHOT.id,
-    )
+    state = _load_state(loader.storage, repo_updated_url, GOURMET_UPDATES_SNAPSHOT)
+    visit_status2 = state.last_visit
 
     assert visit_status1.date < visit_status2.date
     assert visit_status1.snapshot != visit_status2.snapshot
 
-    stats = get_stats(loader.storage)
-    assert stats == {
+    assert state.stats == {
         "content": 22,
         "directory": 28,
         "origin": 1,
@@ -403,94 +442,79 @@ def test_loader_svn_visit_with_changes(svn_loader_cls, swh_storage, datadir, tmp
         "snapshot": 2,
     }
 
-    check_snapshot(GOURMET_UPDATES_SNAPSHOT, loader.storage)
 
-    # Let's start the ingestion from the start, this should yield the same result
+@pytest.mark.slow
+@pytest.mark.parametrize("svn_repo_url", ["pkg-gourmet-with-updates"], indirect=True)
+def test_loader_svn_start_from_scratch_idempotent(
+    svn_loader_cls, swh_storage, tmp_path, svn_repo_url
+):
+    """Loading again a repository from the start should yield the same snapshot"""
+
+    loader = svn_loader_cls(swh_storage, svn_repo_url, temp_directory=tmp_path)
+
+    assert loader.load() == {"status": "eventful"}
+    state = _load_state(loader.storage, svn_repo_url, GOURMET_UPDATES_SNAPSHOT)
+
     loader = svn_loader_cls(
         swh_storage,
-        repo_updated_url,
-        origin_url=repo_initial_url,
+        svn_repo_url,
         incremental=False,
         temp_directory=tmp_path,
     )
     assert loader.load() == {"status": "uneventful"}
-    visit_status3 = assert_last_visit_matches(
-        loader.storage,
-        repo_updated_url,
-        status="full",
-        type="svn",
-        snapshot=GOURMET_UPDATES_SNAPSHOT.id,
-    )
-    assert visit_status2.date < visit_status3.date
-    assert visit_status3.snapshot == visit_status2.snapshot
-    check_snapshot(GOURMET_UPDATES_SNAPSHOT, loader.storage)
+    state2 = _load_state(loader.storage, svn_repo_url, GOURMET_UPDATES_SNAPSHOT)
+    assert state.last_visit.date < state2.last_visit.date
 
-    stats = get_stats(loader.storage)
-    assert stats["origin"] == 1  # always the same visit
-    assert stats["origin_visit"] == 2 + 1  # 1 more visit
-    assert stats["snapshot"] == 2  # no new snapshot
+    # only 1 more visit of the same origin, no new snapshot nor any other object
+    assert state2.stats == {**state.stats, "origin_visit": 1 + 1}
 
 
+@pytest.mark.parametrize("svn_repo_url", ["pkg-gourmet"], indirect=True)
 def test_loader_svn_visit_start_from_revision(
-    svn_loader_cls, swh_storage, datadir, tmp_path
+    svn_loader_cls, swh_storage, datadir, tmp_path, prepare_repository, svn_repo_url
 ):
     """Starting from existing revision, next visit on changed repo should yield 1 new
     snapshot.
 
     """
-    archive_name = "pkg-gourmet"
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_initial_url = prepare_repository_from_archive(
-        archive_path, archive_name, tmp_path
-    )
 
-    # repo_initial_url becomes the origin_url we want to visit some more below
-    loader = svn_loader_cls(swh_storage, repo_initial_url, temp_directory=tmp_path)
+    # svn_repo_url becomes the origin_url we want to visit some more below
+    loader = svn_loader_cls(swh_storage, svn_repo_url, temp_directory=tmp_path)
 
     assert loader.load() == {"status": "eventful"}
     visit_status1 = assert_last_visit_matches(
         loader.storage,
-        repo_initial_url,
+        svn_repo_url,
         status="full",
         type="svn",
         snapshot=GOURMET_SNAPSHOT.id,
     )
     check_snapshot(GOURMET_SNAPSHOT, loader.storage)
 
-    start_revision = loader.storage.revision_get(
-        [hash_to_bytes("95edacc8848369d6fb1608e887d6d2474fd5224f")]
-    )[0]
+    start_revision = loader.storage.revision_get([GOURMET_START_REVISION_ID])[0]
     assert start_revision is not None
 
     archive_path = os.path.join(datadir, "pkg-gourmet-with-updates.tgz")
-    repo_updated_url = prepare_repository_from_archive(
-        archive_path, "pkg-gourmet", tmp_path
-    )
+    repo_updated_url = prepare_repository(archive_path, "pkg-gourmet", tmp_path)
 
     # we'll start from start_revision
     loader = svn_loader_cls(
         swh_storage,
         repo_updated_url,
-        origin_url=repo_initial_url,
+        origin_url=svn_repo_url,
         temp_directory=tmp_path,
     )
 
     assert loader.load() == {"status": "eventful"}
 
     # nonetheless, we obtain the same snapshot (as previous tests on that repository)
-    visit_status2 = assert_last_visit_matches(
-        loader.storage,
-        repo_updated_url,
-        status="full",
-        type="svn",
-        snapshot=GOURMET_UPDATES_SNAPSHOT.id,
-    )
+    state = _load_state(loader.storage, repo_updated_url, GOURMET_UPDATES_SNAPSHOT)
+    visit_status2 = state.last_visit
 
     assert visit_status1.date < visit_status2.date
     assert visit_status1.snapshot != visit_status2.snapshot
 
-    stats = get_stats(loader.storage)
-    assert stats == {
+    assert state.stats == {
         "content": 22,
         "directory": 28,
         "origin": 1,
@@ -501,187 +525,97 @@ def test_loader_svn_visit_start_from_revision(
         "snapshot": 2,
     }
 
-    check_snapshot(GOURMET_UPDATES_SNAPSHOT, loader.storage)
 
-
-def test_loader_svn_visit_with_eol_style(
-    svn_loader_cls, swh_storage, datadir, tmp_path
-):
-    """Check that a svn repo containing a versioned file with CRLF line
-    endings with svn:eol-style property set to 'native' (this is a
-    violation of svn specification as the file should have been
-    stored with LF line endings) can be loaded anyway.
-
-    """
-    archive_name = "mediawiki-repo-r407-eol-native-crlf"
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
-
-    loader = svn_loader_cls(swh_storage, repo_url, temp_directory=tmp_path)
-
-    assert loader.load() == {"status": "eventful"}
-    mediawiki_snapshot = Snapshot(
-        id=hash_to_bytes("d6d6e9703f157c5702d9a4a5dec878926ed4ab76"),
-        branches={
-            b"HEAD": SnapshotBranch(
-                target=hash_to_bytes("7da4975c363101b819756d33459f30a866d01b1b"),
-                target_type=SnapshotTargetType.REVISION,
-            )
-        },
-    )
-    check_snapshot(mediawiki_snapshot, loader.storage)
-
-    assert_last_visit_matches(
-        loader.storage,
-        repo_url,
-        status="full",
-        type="svn",
-        snapshot=mediawiki_snapshot.id,
-    )
-
-    stats = get_stats(loader.storage)
-    assert stats["origin"] == 1
-    assert stats["origin_visit"] == 1
-    assert stats["snapshot"] == 1
-
-
-def test_loader_svn_visit_with_mixed_crlf_lf(
-    svn_loader_cls, swh_storage, datadir, tmp_path
+@pytest.mark.parametrize(
+    "svn_repo_url,expected_snapshot,expected_stats",
+    [
+        pytest.param(
+            "pkg-gourmet",
+            GOURMET_SNAPSHOT,
+            {
+                "content": 19,
+                "directory": 17,
+                "origin": 1,
+                "origin_visit": 1,
+                "release": 0,
+                "revision": 6,
+                "skipped_content": 0,
+                "snapshot": 1,
+            },
+            id="gourmet",
+        ),
+        # repository containing a versioned file with CRLF line endings with
+        # svn:eol-style property set to 'native' (this is a violation of svn
+        # specification as the file should have been stored with LF line endings)
+        pytest.param(
+            "mediawiki-repo-r407-eol-native-crlf",
+            MEDIAWIKI_SNAPSHOT,
+            {"origin": 1, "origin_visit": 1, "snapshot": 1},
+            id="eol-style",
+        ),
+        # repository containing a versioned file with mixed CRLF/LF line endings
+        # with svn:eol-style property set to 'native' (this is a violation of svn
+        # specification as mixed line endings for textual content should not be
+        # stored when the svn:eol-style property is set)
+        pytest.param(
+            "pyang-repo-r343-eol-native-mixed-lf-crlf",
+            PYANG_SNAPSHOT,
+            {"origin": 1, "origin_visit": 1, "snapshot": 1},
+            id="mixed-crlf-lf",
+        ),
+        # a file is created and committed, then removed and a folder holding the
+        # same name is added and committed, same scenario with a symbolic link
+        pytest.param(
+            "pkg-gourmet-with-edge-case-links-and-files",
+            GOURMET_EDGE_CASES_SNAPSHOT,
+            {"origin": 1, "origin_visit": 1, "snapshot": 1, "revision": 19},
+            id="symlink",
+        ),
+        # wrong symbolic links, including ones with empty space names
+        pytest.param(
+            "pkg-gourmet-with-wrong-link-cases",
+            GOURMET_WRONG_LINKS_SNAPSHOT,
+            {"origin": 1, "origin_visit": 1, "snapshot": 1, "revision": 21},
+            id="wrong-symlinks",
+        ),
+        # user defined svn properties with special encodings, that we do not ingest
+        pytest.param(
+            "httthttt",
+            HTTTHTTT_SNAPSHOT,
+            {"origin": 1, "origin_visit": 1, "snapshot": 1, "revision": 7},
+            id="user-defined-svn-properties",
+        ),
+    ],
+    indirect=["svn_repo_url"],
+)
+def test_loader_svn_new_visit(
+    svn_loader_cls,
+    swh_storage,
+    tmp_path,
+    svn_repo_url,
+    expected_snapshot,
+    expected_stats,
 ):
-    """Check that a svn repo containing a versioned file with mixed
-    CRLF/LF line endings with svn:eol-style property set to 'native'
-    (this is a violation of svn specification as mixed line endings
-    for textual content should not be stored when the svn:eol-style
-    property is set) can be loaded anyway.
-
-    """
-    archive_name = "pyang-repo-r343-eol-native-mixed-lf-crlf"
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
-
-    loader = svn_loader_cls(swh_storage, repo_url, temp_directory=tmp_path)
-
-    assert loader.load() == {"status": "eventful"}
-    pyang_snapshot = Snapshot(
-        id=hash_to_bytes("6d9590de11b00a5801de0ff3297c5b44bbbf7d24"),
-        branches={
-            b"HEAD": SnapshotBranch(
-                target=hash_to_bytes("9c6962eeb9164a636c374be700672355e34a98a7"),
-                target_type=SnapshotTargetType.REVISION,
-            )
-        },
-    )
-    check_snapshot(pyang_snapshot, loader.storage)
-
-    assert_last_visit_matches(
-        loader.storage,
-        repo_url,
-        status="full",
-        type="svn",
-        snapshot=pyang_snapshot.id,
-    )
-
-    stats = get_stats(loader.storage)
-    assert stats["origin"] == 1
-    assert stats["origin_visit"] == 1
-    assert stats["snapshot"] == 1
-
-
-def test_loader_svn_with_symlink(svn_loader_cls, swh_storage, datadir, tmp_path):
-    """Repository with symlinks should be ingested ok
-
-    Edge case:
-       - first create a file and commit it.
-         Remove it, then add folder holding the same name, commit.
-       - do the same scenario with symbolic link (instead of file)
+    """Eventful visit should yield 1 snapshot, including for repositories holding
+    edge cases"""
 
-    """
-    archive_name = "pkg-gourmet"
-    archive_path = os.path.join(
-        datadir, "pkg-gourmet-with-edge-case-links-and-files.tgz"
-    )
-    repo_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
-
-    loader = svn_loader_cls(swh_storage, repo_url, temp_directory=tmp_path)
+    loader = svn_loader_cls(swh_storage, svn_repo_url, temp_directory=tmp_path)
 
     assert loader.load() == {"status": "eventful"}
-    gourmet_edge_cases_snapshot = Snapshot(
-        id=hash_to_bytes("18e60982fe521a2546ab8c3c73a535d80462d9d0"),
-        branches={
-            b"HEAD": SnapshotBranch(
-                target=hash_to_bytes("3f43af2578fccf18b0d4198e48563da7929dc608"),
-                target_type=SnapshotTargetType.REVISION,
-            )
-        },
-    )
-    check_snapshot(gourmet_edge_cases_snapshot, loader.storage)
-
-    assert_last_visit_matches(
-        loader.storage,
-        repo_url,
-        status="full",
-        type="svn",
-        snapshot=gourmet_edge_cases_snapshot.id,
-    )
-
-    stats = get_stats(loader.storage)
-    assert stats["origin"] == 1
-    assert stats["origin_visit"] == 1
-    assert stats["snapshot"] == 1
-    assert stats["revision"] == 19
-
+    assert loader.snapshot == expected_snapshot
 
-def test_loader_svn_with_wrong_symlinks(svn_loader_cls, swh_storage, datadir, tmp_path):
-    """Repository with wrong symlinks should be ingested ok nonetheless
+    state = _load_state(loader.storage, svn_repo_url, expected_snapshot)
+    assert {key: state.stats[key] for key in expected_stats} == expected_stats
 
-    Edge case:
-       - wrong symbolic link
-       - wrong symbolic link with empty space names
 
-    """
-    archive_name = "pkg-gourmet"
-    archive_path = os.path.join(datadir, "pkg-gourmet-with-wrong-link-cases.tgz")
-    repo_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
-
-    loader = svn_loader_cls(swh_storage, repo_url, temp_directory=tmp_path)
-
-    assert loader.load() == {"status": "eventful"}
-    gourmet_wrong_links_snapshot = Snapshot(
-        id=hash_to_bytes("b17f38acabb90f066dedd30c29f01a02af88a5c4"),
-        branches={
-            b"HEAD": SnapshotBranch(
-                target=hash_to_bytes("cf30d3bb9d5967d0a2bbeacc405f10a5dd9b138a"),
-                target_type=SnapshotTargetType.REVISION,
-            )
-        },
-    )
-    check_snapshot(gourmet_wrong_links_snapshot, loader.storage)
-
-    assert_last_visit_matches(
-        loader.storage,
-        repo_url,
-        status="full",
-        type="svn",
-        snapshot=gourmet_wrong_links_snapshot.id,
-    )
-
-    stats = get_stats(loader.storage)
-    assert stats["origin"] == 1
-    assert stats["origin_visit"] == 1
-    assert stats["snapshot"] == 1
-    assert stats["revision"] == 21
-
-
-def test_loader_svn_cleanup_loader(svn_loader_cls, swh_storage, datadir, tmp_path):
+@pytest.mark.parametrize("svn_repo_url", ["pkg-gourmet"], indirect=True)
+def test_loader_svn_cleanup_loader(svn_loader_cls, swh_storage, tmp_path, svn_repo_url):
     """Loader should clean up its working directory after the load"""
-    archive_name = "pkg-gourmet"
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
 
     loading_temp_directory = str(tmp_path / "loading")
     os.mkdir(loading_temp_directory)
     loader = svn_loader_cls(
-        swh_storage, repo_url, temp_directory=loading_temp_directory
+        swh_storage, svn_repo_url, temp_directory=loading_temp_directory
     )
     assert loader.load() == {"status": "eventful"}
 
@@ -691,17 +625,17 @@ def test_loader_svn_cleanup_loader(svn_loader_cls, swh_storage, datadir, tmp_pat
     assert os.listdir(loader.temp_directory) == []
 
 
-def test_loader_svn_cleanup_loader_from_remote_dump(swh_storage, datadir, tmp_path):
+@pytest.mark.parametrize("svn_repo_url", ["pkg-gourmet"], indirect=True)
+def test_loader_svn_cleanup_loader_from_remote_dump(
+    swh_storage, tmp_path, svn_repo_url
+):
     """Loader should clean up its working directory after the load"""
-    archive_name = "pkg-gourmet"
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
 
     loading_temp_directory = str(tmp_path / "loading")
     os.mkdir(loading_temp_directory)
 
     loader = SvnLoaderFromRemoteDump(
-        swh_storage, repo_url, temp_directory=loading_temp_directory
+        swh_storage, svn_repo_url, temp_directory=loading_temp_directory
     )
     assert loader.load() == {"status": "eventful"}
 
@@ -720,7 +654,7 @@ def test_loader_svn_cleanup_loader_from_dump_archive(swh_storage, datadir, tmp_p
     os.mkdir(archive_dump_dir)
     archive_dump = os.path.join(archive_dump_dir, "penguinsdbtools2018.dump.gz")
     # loader now drops the dump as soon as it's mounted so we need to make a copy first
-    shutil.copyfile(archive_ori_dump, archive_dump)
+    link_or_copy(archive_ori_dump, archive_dump)
 
     loading_path = str(tmp_path / "loading")
     os.mkdir(loading_path)
@@ -742,11 +676,13 @@ def test_loader_svn_cleanup_loader_from_dump_archive(swh_storage, datadir, tmp_p
     assert not os.path.exists(loader.temp_dir)
 
 
-def test_svn_loader_from_remote_dump(swh_storage, datadir, tmpdir_factory):
+def test_svn_loader_from_remote_dump(
+    swh_storage, datadir, tmpdir_factory, prepare_repository
+):
     archive_name = "pkg-gourmet"
     archive_path = os.path.join(datadir, f"{archive_name}.tgz")
     tmp_path = tmpdir_factory.mktemp("repo1")
-    repo_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
+    repo_url = prepare_repository(archive_path, archive_name, tmp_path)
 
     loaderFromDump = SvnLoaderFromRemoteDump(
         swh_storage, repo_url, temp_directory=tmp_path
@@ -762,7 +698,7 @@ def test_svn_loader_from_remote_dump(swh_storage, datadir, tmpdir_factory):
 
     # rename to another origin
     tmp_path = tmpdir_factory.mktemp("repo2")
-    origin_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
+    origin_url = prepare_repository(archive_path, archive_name, tmp_path)
 
     loader = SvnLoader(
         swh_storage, repo_url, origin_url=origin_url, temp_directory=tmp_path
@@ -779,9 +715,16 @@ def test_svn_loader_from_remote_dump(swh_storage, datadir, tmpdir_factory):
     check_snapshot(GOURMET_SNAPSHOT, loader.storage)
 
     stats = get_stats(loader.storage)
-    assert stats["origin"] == 2  # created one more origin
-    assert stats["origin_visit"] == 2
-    assert stats["snapshot"] == 1
+    assert stats == {
+        "content": 19,
+        "directory": 17,
+        "origin": 2,  # created one more origin
+        "origin_visit": 2,
+        "release": 0,
+        "revision": 6,
+        "skipped_content": 0,
+        "snapshot": 1,
+    }
 
     loader = SvnLoader(
         swh_storage, repo_url, temp_directory=tmp_path
@@ -796,9 +739,16 @@ def test_svn_loader_from_remote_dump(swh_storage, datadir, tmpdir_factory):
     )
 
     stats = get_stats(loader.storage)
-    assert stats["origin"] == 2
-    assert stats["origin_visit"] == 3
-    assert stats["snapshot"] == 1
+    assert stats == {
+        "content": 19,
+        "directory": 17,
+        "origin": 2,
+        "origin_visit": 3,
+        "release": 0,
+        "revision": 6,
+        "skipped_content": 0,
+        "snapshot": 1,
+    }
 
     # second visit from the dump should be uneventful
     loaderFromDump = SvnLoaderFromRemoteDump(
@@ -807,22 +757,20 @@ def test_svn_loader_from_remote_dump(swh_storage, datadir, tmpdir_factory):
     assert loaderFromDump.load() == {"status": "uneventful"}
 
 
+@pytest.mark.parametrize("svn_repo_url", ["pkg-gourmet"], indirect=True)
 def test_svn_loader_from_remote_dump_incremental_load_on_stale_repo(
-    swh_storage, datadir, tmp_path, mocker
+    swh_storage, tmp_path, mocker, svn_repo_url
 ):
-    archive_name = "pkg-gourmet"
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
 
     # first load: a dump file will be created, mounted to a local repository
     # and the latter will be loaded into the archive
     loaderFromDump = SvnLoaderFromRemoteDump(
-        swh_storage, repo_url, temp_directory=tmp_path
+        swh_storage, svn_repo_url, temp_directory=tmp_path
     )
     assert loaderFromDump.load() == {"status": "eventful"}
     assert_last_visit_matches(
         loaderFromDump.storage,
-        repo_url,
+        svn_repo_url,
         status="full",
         type="svn",
         snapshot=GOURMET_SNAPSHOT.id,
@@ -831,7 +779,7 @@ def test_svn_loader_from_remote_dump_incremental_load_on_stale_repo(
     # second load on same repository: the loader will detect there is no changes
     # since last load and will skip the dump, mount and load phases
     loaderFromDump = SvnLoaderFromRemoteDump(
-        swh_storage, repo_url, temp_directory=tmp_path
+        swh_storage, svn_repo_url, temp_directory=tmp_path
     )
 
     loaderFromDump.dump_svn_revisions = mocker.MagicMock()
@@ -844,7 +792,7 @@ def test_svn_loader_from_remote_dump_incremental_load_on_stale_repo(
     assert loaderFromDump.load() == {"status": "uneventful"}
     assert_last_visit_matches(
         loaderFromDump.storage,
-        repo_url,
+        svn_repo_url,
         status="full",
         type="svn",
         snapshot=GOURMET_SNAPSHOT.id,
@@ -860,21 +808,17 @@ def test_svn_loader_from_remote_dump_incremental_load_on_stale_repo(
     loaderFromDump._check_revision_divergence.assert_not_called()
 
 
+@pytest.mark.parametrize("svn_repo_url", ["pkg-gourmet"], indirect=True)
 def test_svn_loader_from_remote_dump_incremental_load_on_non_stale_repo(
-    swh_storage, datadir, tmp_path, mocker
+    swh_storage, datadir, tmp_path, mocker, prepare_repository, svn_repo_url
 ):
-    archive_name = "pkg-gourmet"
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
 
     # first load
-    loader = SvnLoaderFromRemoteDump(swh_storage, repo_url, temp_directory=tmp_path)
+    loader = SvnLoaderFromRemoteDump(swh_storage, svn_repo_url, temp_directory=tmp_path)
     loader.load()
 
     archive_path = os.path.join(datadir, "pkg-gourmet-with-updates.tgz")
-    repo_updated_url = prepare_repository_from_archive(
-        archive_path, archive_name, tmp_path
-    )
+    repo_updated_url = prepare_repository(archive_path, "pkg-gourmet", tmp_path)
 
     # second load
     loader = SvnLoaderFromRemoteDump(
@@ -890,108 +834,59 @@ def test_svn_loader_from_remote_dump_incremental_load_on_non_stale_repo(
     process_svn_revisions.assert_called()
 
 
-def test_loader_user_defined_svn_properties(
-    svn_loader_cls, swh_storage, datadir, tmp_path
+@pytest.mark.parametrize("svn_repo_url", ["pkg-gourmet-add-remove-dir"], indirect=True)
+def test_loader_svn_dir_added_then_removed(
+    svn_loader_cls, swh_storage, tmp_path, svn_repo_url
 ):
-    """Edge cases: The repository held some user defined svn-properties with special
-    encodings, this prevented the repository from being loaded even though we do not
-    ingest those information.
-
-    """
-    archive_name = "httthttt"
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
+    """Loader should handle directory removal when processing a commit"""
 
-    loader = svn_loader_cls(swh_storage, repo_url)
+    loader = svn_loader_cls(swh_storage, svn_repo_url, temp_directory=tmp_path)
 
     assert loader.load() == {"status": "eventful"}
-    expected_snapshot = Snapshot(
-        id=hash_to_bytes("70487267f682c07e52a2371061369b6cf5bffa47"),
-        branches={
-            b"HEAD": SnapshotBranch(
-                target=hash_to_bytes("604a17dbb15e8d7ecb3e9f3768d09bf493667a93"),
-                target_type=SnapshotTargetType.REVISION,
-            )
-        },
-    )
-    check_snapshot(expected_snapshot, loader.storage)
-
     assert_last_visit_matches(
         loader.storage,
-        repo_url,
+        svn_repo_url,
         status="full",
         type="svn",
-        snapshot=expected_snapshot.id,
     )
-
-    stats = get_stats(loader.storage)
-    assert stats["origin"] == 1
-    assert stats["origin_visit"] == 1
-    assert stats["snapshot"] == 1
-    assert stats["revision"] == 7
+    check_snapshot(loader.snapshot, loader.storage)
 
 
-def test_loader_svn_dir_added_then_removed(
-    svn_loader_cls, swh_storage, datadir, tmp_path
-):
-    """Loader should handle directory removal when processing a commit"""
-    archive_name = "pkg-gourmet"
-    archive_path = os.path.join(datadir, f"{archive_name}-add-remove-dir.tgz")
-    repo_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
+@pytest.mark.parametrize("svn_repo_url", ["pkg-gourmet"], indirect=True)
+def test_loader_svn_loader_from_dump_archive(swh_storage, tmp_path, svn_repo_url):
+    # create compressed dump file of pkg-gourmet repo
+    dump_path = _dump_project(tmp_path, svn_repo_url)
 
-    loader = svn_loader_cls(swh_storage, repo_url, temp_directory=tmp_path)
+    # load svn repo from that compressed dump file
+    loader = SvnLoaderFromDumpArchive(
+        swh_storage,
+        url=svn_repo_url,
+        archive_path=dump_path,
+        temp_directory=tmp_path,
+    )
 
     assert loader.load() == {"status": "eventful"}
+
     assert_last_visit_matches(
         loader.storage,
-        repo_url,
+        svn_repo_url,
         status="full",
         type="svn",
+        snapshot=GOURMET_SNAPSHOT.id,
     )
-    check_snapshot(loader.snapshot, loader.storage)
-
-
-def test_loader_svn_loader_from_dump_archive(swh_storage, datadir, tmp_path):
-    archive_name = "pkg-gourmet"
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
-    dump_filename = f"{archive_name}.dump"
-
-    with open(os.path.join(tmp_path, dump_filename), "wb") as dump_file:
-        # create compressed dump file of pkg-gourmet repo
-        subprocess.run(["svnrdump", "dump", repo_url], stdout=dump_file)
-        subprocess.run(["gzip", dump_filename], cwd=tmp_path)
-
-        # load svn repo from that compressed dump file
-        loader = SvnLoaderFromDumpArchive(
-            swh_storage,
-            url=repo_url,
-            archive_path=os.path.join(tmp_path, f"{dump_filename}.gz"),
-            temp_directory=tmp_path,
-        )
-
-        assert loader.load() == {"status": "eventful"}
-
-        assert_last_visit_matches(
-            loader.storage,
-            repo_url,
-            status="full",
-            type="svn",
-            snapshot=GOURMET_SNAPSHOT.id,
-        )
 
-        check_snapshot(GOURMET_SNAPSHOT, loader.storage)
+    check_snapshot(GOURMET_SNAPSHOT, loader.storage)
 
-        assert get_stats(loader.storage) == {
-            "content": 19,
-            "directory": 17,
-            "origin": 1,
-            "origin_visit": 1,
-            "release": 0,
-            "revision": 6,
-            "skipped_content": 0,
-            "snapshot": 1,
-        }
+    assert get_stats(loader.storage) == {
+        "content": 19,
+        "directory": 17,
+        "origin": 1,
+        "origin_visit": 1,
+        "release": 0,
+        "revision": 6,
+        "skipped_content": 0,
+        "snapshot": 1,
+    }
 
 
 def test_loader_eol_style_file_property_handling_edge_case(
@@ -1078,10 +973,10 @@ def get_head_revision_paths_info(loader: SvnLoader) -> Dict[bytes, Dict[str, Any
     revision = loader.storage.revision_get([root_dir])[0]
     assert revision is not None
 
-    paths = {}
-    for entry in loader.storage.directory_ls(revision.directory, recursive=True):
-        paths[entry["name"]] = entry
-    return paths
+    return {
+        entry["name"]: entry
+        for entry in loader.storage.directory_ls(revision.directory, recursive=True)
+    }
 
 
 def test_loader_eol_style_on_svn_link_handling(
@@ -1111,12 +1006,10 @@ def test_loader_eol_style_on_svn_link_handling(
         ],
     )
 
-    # instantiate a svn loader checking after each processed revision that
-    # the repository filesystem it reconstructed does not differ from a subversion
-    # export of that revision
-    loader = svn_loader_cls(
-        swh_storage, repo_url, temp_directory=tmp_path, check_revision=1
-    )
+    # only one revision is loaded, the filesystem reconstructed for it is already
+    # compared to a subversion export of it at the end of the visit so there is
+    # no need to check each processed revision (check_revision=1)
+    loader = svn_loader_cls(swh_storage, repo_url, temp_directory=tmp_path)
 
     assert loader.load() == {"status": "eventful"}
     assert_last_visit_matches(
@@ -1270,12 +1163,10 @@ def test_loader_invalid_svn_eol_style_property_value(
         ],
     )
 
-    # instantiate a svn loader checking after each processed revision that
-    # the repository filesystem it reconstructed does not differ from a subversion
-    # export of that revision
-    loader = svn_loader_cls(
-        swh_storage, repo_url, temp_directory=tmp_path, check_revision=1
-    )
+    # only one revision is loaded, the filesystem reconstructed for it is already
+    # compared to a subversion export of it at the end of the visit so there is
+    # no need to check each processed revision (check_revision=1)
+    loader = svn_loader_cls(swh_storage, repo_url, temp_directory=tmp_path)
 
     assert loader.load() == {"status": "eventful"}
     assert_last_visit_matches(
@@ -1426,24 +1317,24 @@ def test_loader_svn_special_property_on_binary_file(
     check_snapshot(loader.snapshot, loader.storage)
 
 
+@pytest.mark.parametrize("svn_repo_url", ["pkg-gourmet"], indirect=True)
 def test_loader_last_revision_divergence(
-    svn_loader_cls, swh_storage, datadir, tmp_path
+    svn_loader_cls, swh_storage, tmp_path, svn_repo_url
 ):
-    archive_name = "pkg-gourmet"
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
 
     class SvnLoaderRevisionDivergence(svn_loader_cls):
         def _check_revision_divergence(self, count, rev, dir_id):
             raise ValueError("revision divergence detected")
 
-    loader = SvnLoaderRevisionDivergence(swh_storage, repo_url, temp_directory=tmp_path)
+    loader = SvnLoaderRevisionDivergence(
+        swh_storage, svn_repo_url, temp_directory=tmp_path
+    )
 
     assert loader.load()["status"] == "failed"
 
     assert_last_visit_matches(
         loader.storage,
-        repo_url,
+        svn_repo_url,
         status="partial",
         type="svn",
         snapshot=GOURMET_SNAPSHOT.id,
@@ -1640,8 +1531,6 @@ def test_svn_loader_incremental_replay_start_with_empty_directory(
             ]
             yield from super().swh_hash_data_per_revision(start_revision, end_revision)
 
-    from swh.loader.svn import loader
-
     mocker.patch(
         "swh.loader.svn.svn_repo.SvnRepo", SvnRepoCheckReplayStartWithEmptyDirectory
     )
@@ -1820,12 +1709,10 @@ def test_loader_svn_link_parsing(svn_loader_cls, swh_storage, repo_url, tmp_path
     check_snapshot(loader.snapshot, loader.storage)
 
 
+@pytest.mark.parametrize("svn_repo_url", ["pkg-gourmet"], indirect=True)
 def test_loader_svn_empty_local_dir_before_post_load(
-    svn_loader_cls, swh_storage, datadir, tmp_path
+    svn_loader_cls, swh_storage, tmp_path, svn_repo_url
 ):
-    archive_name = "pkg-gourmet"
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
 
     class SvnLoaderPostLoadLocalDirIsEmpty(svn_loader_cls):
         def post_load(self, success=True):
@@ -1838,7 +1725,7 @@ def test_loader_svn_empty_local_dir_before_post_load(
             return super().post_load(success)
 
     loader = SvnLoaderPostLoadLocalDirIsEmpty(
-        swh_storage, repo_url, temp_directory=tmp_path
+        swh_storage, svn_repo_url, temp_directory=tmp_path
     )
 
     assert loader.load() == {"status": "eventful"}
@@ -1847,7 +1734,7 @@ def test_loader_svn_empty_local_dir_before_post_load(
 
     assert_last_visit_matches(
         loader.storage,
-        repo_url,
+        svn_repo_url,
         status="full",
         type="svn",
         snapshot=GOURMET_SNAPSHOT.id,
@@ -1856,12 +1743,17 @@ def test_loader_svn_empty_local_dir_before_post_load(
 
 
 def _dump_project(tmp_path, origin_url):
-    svnrdump_cmd = ["svnrdump", "dump", origin_url]
-    dump_path = f"{tmp_path}/repo.dump"
-    with open(dump_path, "wb") as dump_file:
-        subprocess.run(svnrdump_cmd, stdout=dump_file)
-    subprocess.run(["gzip", dump_path])
-    return dump_path + ".gz"
+    """Dump a repository with svnrdump into a gzip compressed file, compressing
+    in process rather than with an extra gzip process."""
+    dump_path = f"{tmp_path}/repo.dump.gz"
+    with subprocess.Popen(
+        ["svnrdump", "dump", origin_url], stdout=subprocess.PIPE
+    ) as svnrdump:
+        # the dump is only read back once, favor speed over compression ratio
+        with gzip.open(dump_path, "wb", compresslevel=1) as dump_file:
+            shutil.copyfileobj(svnrdump.stdout, dump_file, 1024 * 1024)
+    assert svnrdump.returncode == 0
+    return dump_path
 
 
 def test_loader_svn_add_property_on_directory_link(
@@ -2096,21 +1988,19 @@ def test_loader_subproject_root_dir_removal(
     assert loader.load() == {"status": "uneventful"}
 
 
+@pytest.mark.parametrize("svn_repo_url", ["pkg-gourmet"], indirect=True)
 @pytest.mark.parametrize("svn_loader_cls", [SvnLoader, SvnLoaderFromRemoteDump])
 def test_loader_svn_not_found_after_successful_visit(
-    swh_storage, datadir, tmp_path, svn_loader_cls
+    swh_storage, tmp_path, svn_loader_cls, svn_repo_url
 ):
-    archive_name = "pkg-gourmet"
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
 
-    loader = svn_loader_cls(swh_storage, repo_url, temp_directory=tmp_path)
+    loader = svn_loader_cls(swh_storage, svn_repo_url, temp_directory=tmp_path)
 
     assert loader.load() == {"status": "eventful"}
 
     assert_last_visit_matches(
         loader.storage,
-        repo_url,
+        svn_repo_url,
         status="full",
         type="svn",
         snapshot=GOURMET_SNAPSHOT.id,
@@ -2118,14 +2008,14 @@ def test_loader_svn_not_found_after_successful_visit(
     check_snapshot(loader.snapshot, loader.storage)
 
     # simulate removal of remote repository
-    shutil.rmtree(repo_url.replace("file://", ""))
+    shutil.rmtree(svn_repo_url.replace("file://", ""))
 
-    loader = svn_loader_cls(swh_storage, repo_url, temp_directory=tmp_path)
+    loader = svn_loader_cls(swh_storage, svn_repo_url, temp_directory=tmp_path)
 
     assert loader.load() == {"status": "uneventful"}
     assert_last_visit_matches(
         loader.storage,
-        repo_url,
+        svn_repo_url,
         status="not_found",
         type="svn",
         snapshot=None,
@@ -2529,14 +2419,8 @@ def test_loader_svnrepo_propget_on_url(svn_loader_cls, swh_storage, repo_url, tm
         ],
     )
 
-    # load it
-    loader = svn_loader_cls(
-        swh_storage,
-        repo_url,
-        temp_directory=tmp_path,
-        debug=True,
-        check_revision=1,
-    )
+    # load it, only to query properties through its svn repository
+    loader = svn_loader_cls(swh_storage, repo_url, temp_directory=tmp_path, debug=True)
     assert loader.load() == {"status": "eventful"}
 
     foo_file_url = f"{repo_url}/trunk/data/foo"
@@ -11,22 +11,18 @@ from subvertpy.ra import Auth, RemoteAccess, get_username_provider
 
 from swh.loader.svn.svn_repo import SvnRepo
 from swh.loader.svn.svn_retry import SVN_RETRY_MAX_ATTEMPTS, SVN_RETRY_WAIT_EXP_BASE
-from swh.loader.tests import prepare_repository_from_archive
-
-
-def _get_repo_url(archive_name, datadir, tmp_path):
-    archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    return prepare_repository_from_archive(archive_path, "pkg-gourmet", tmp_path)
 
 
 @pytest.fixture()
-def sample_repo_url(datadir, tmp_path):
-    return _get_repo_url("pkg-gourmet", datadir, tmp_path)
+def sample_repo_url(datadir, tmp_path, prepare_repository):
+    archive_path = os.path.join(datadir, "pkg-gourmet.tgz")
+    return prepare_repository(archive_path, "pkg-gourmet", tmp_path)
 
 
 @pytest.fixture()
-def sample_repo_with_externals_url(datadir, tmp_path):
-    return _get_repo_url("pkg-gourmet-with-external-id", datadir, tmp_path)
+def sample_repo_with_externals_url(datadir, tmp_path, prepare_repository):
+    archive_path = os.path.join(datadir, "pkg-gourmet-with-external-id.tgz")
+    return prepare_repository(archive_path, "pkg-gourmet", tmp_path)
 
 
 class SVNClientWrapper:
@@ -9,15 +9,13 @@ import os
 from pathlib import Path
 import pty
 import re
-import shutil
 from subprocess import Popen, run
 
 import pytest
 
 from swh.loader.svn import utils
-from swh.loader.tests import prepare_repository_from_archive
 
-from .utils import CommitChange, CommitChangeType, add_commit
+from .utils import CommitChange, CommitChangeType, add_commit, link_or_copy
 
 
 def test_outputstream():
@@ -67,7 +65,7 @@ def test_init_svn_repo_from_dump_and_cleanup(datadir, tmp_path):
     dump_ori_path = os.path.join(datadir, dump_name)
 
     dump_path = os.path.join(tmp_path, dump_name)
-    shutil.copyfile(dump_ori_path, dump_path)
+    link_or_copy(dump_ori_path, dump_path)
 
     assert os.path.exists(dump_path)
     assert os.path.exists(dump_ori_path)
@@ -94,7 +92,7 @@ def test_init_svn_repo_from_dump_and_cleanup_already_done(
     mock_remove.side_effect = FileNotFoundError
 
     dump_path = os.path.join(tmp_path, dump_name)
-    shutil.copyfile(dump_ori_path, dump_path)
+    link_or_copy(dump_ori_path, dump_path)
 
     assert os.path.exists(dump_path)
     assert os.path.exists(dump_ori_path)
@@ -111,13 +109,13 @@ def test_init_svn_repo_from_dump_and_cleanup_already_done(
     assert mock_remove.called
 
 
-def test_init_svn_repo_from_truncated_dump(datadir, tmp_path):
+def test_init_svn_repo_from_truncated_dump(datadir, tmp_path, prepare_repository):
     """Mounting partial svn repository from a truncated dump should work"""
 
     # prepare a repository
     archive_name = "pkg-gourmet"
     archive_path = os.path.join(datadir, f"{archive_name}.tgz")
-    repo_url = prepare_repository_from_archive(archive_path, archive_name, tmp_path)
+    repo_url = prepare_repository(archive_path, archive_name, tmp_path)
 
     # dump it to file
     dump_path = str(tmp_path / f"{archive_name}.dump")
@@ -169,7 +167,7 @@ def test_init_svn_repo_from_archive_dump_and_cleanup(datadir, tmp_path):
     dump_ori_path = os.path.join(datadir, dump_name)
 
     dump_path = os.path.join(tmp_path, dump_name)
-    shutil.copyfile(dump_ori_path, dump_path)
+    link_or_copy(dump_ori_path, dump_path)
 
     assert os.path.exists(dump_path)
     assert os.path.exists(dump_ori_path)
@@ -3,16 +3,29 @@
 # License: GNU General Public License version 3, or any later version
 # See top-level LICENSE file for more information
 
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+import hashlib
 from io import BytesIO
 import os
-from typing import Dict, List, Optional
+import shutil
+import tarfile
+import tempfile
+from typing import BinaryIO, Dict, Iterator, List, Optional, Set
+import uuid
 
 from subvertpy import SubversionException, delta, repos
 from subvertpy.ra import Auth, RemoteAccess, get_username_provider
 from typing_extensions import TypedDict
 
+try:
+    # SIMD accelerated inflate, several times faster than zlib
+    from isal import igzip as gzip
+except ImportError:
+    import gzip  # type: ignore[no-redef]
+
 
 class CommitChangeType(Enum):
     AddOrUpdate = 1
@@ -28,45 +41,126 @@ class CommitChange(TypedDict, total=False):
     copyfrom_rev: int
 
 
+def _open_remote_access(repo_url: str) -> RemoteAccess:
+    return RemoteAccess(repo_url, auth=Auth([get_username_provider()]))
+
+
+class CommitSession:
+    """Connections to the repositories a test commits to with :func:`add_commit`,
+    reused across the successive commits of that test, and paths those commits
+    created in each repository."""
+
+    def __init__(self) -> None:
+        self.connections: Dict[str, RemoteAccess] = {}
+        self.known_paths: Dict[str, Set[str]] = {}
+
+    def remote_access(self, repo_url: str) -> RemoteAccess:
+        if repo_url not in self.connections:
+            self.connections[repo_url] = _open_remote_access(repo_url)
+        return self.connections[repo_url]
+
+
+# session of the running test, see commit_session
+_commit_session: Optional[CommitSession] = None
+
+
+@contextmanager
+def commit_session() -> Iterator[CommitSession]:
+    """Make the :func:`add_commit` calls of the enclosed block share a
+    :class:`CommitSession`, outside of it each call opens its own connection."""
+    global _commit_session
+    session = _commit_session = CommitSession()
+    try:
+        yield session
+    finally:
+        # release repository handles held by the connections
+        session.connections.clear()
+        _commit_session = None
+
+
+def _remote_access(repo_url: str) -> RemoteAccess:
+    if _commit_session is None:
+        return _open_remote_access(repo_url)
+    return _commit_session.remote_access(repo_url)
+
+
 def add_commit(
     repo_url: str,
     message: str,
     changes: List[CommitChange],
     date: Optional[datetime] = None,
 ) -> None:
-    conn = RemoteAccess(repo_url, auth=Auth([get_username_provider()]))
+    conn = _remote_access(repo_url)
     editor = conn.get_commit_editor({"svn:log": message})
     root = editor.open_root()
+    # paths created by previous commits of the session are opened before trying
+    # to add them, the other way around for the others, as they may have been
+    # created by other means (archived repositories, directory copies...)
+    session_paths = (
+        _commit_session.known_paths.get(repo_url, set())
+        if _commit_session is not None
+        else set()
+    )
+    # only recorded in the session once that commit succeeded
+    known_paths = set(session_paths)
     for change in changes:
         if change["change_type"] == CommitChangeType.Delete:
-            root.delete_entry(change["path"].rstrip("/"))
+            deleted_path = change["path"].rstrip("/")
+            root.delete_entry(deleted_path)
+            known_paths = {
+                known_path
+                for known_path in known_paths
+                if known_path != deleted_path
+                and not known_path.startswith(deleted_path + "/")
+            }
         else:
             dir_change = change["path"].endswith("/")
             split_path = change["path"].rstrip("/").split("/")
             copyfrom_path = change.get("copyfrom_path")
             copyfrom_rev = change.get("copyfrom_rev", -1)
-            for i in range(len(split_path)):
-                path = "/".join(split_path[0 : i + 1])
+            path = ""
+            for i, path_part in enumerate(split_path):
+                path = f"{path}/{path_part}" if path else path_part
+                known_path = path in known_paths
+                known_paths.add(path)
                 if i < len(split_path) - 1:
+                    if known_path:
+                        continue
                     try:
                         root.add_directory(path, copyfrom_path, copyfrom_rev).close()
                     except SubversionException:
                         pass
                 else:
                     if dir_change:
-                        try:
-                            dir = root.add_directory(path, copyfrom_path, copyfrom_rev)
-                        except SubversionException:
-                            dir = root.open_directory(path)
+                        if known_path:
+                            try:
+                                dir = root.open_directory(path)
+                            except SubversionException:
+                                dir = root.add_directory(
+                                    path, copyfrom_path, copyfrom_rev
+                                )
+                        else:
+                            try:
+                                dir = root.add_directory(
+                                    path, copyfrom_path, copyfrom_rev
+                                )
+                            except SubversionException:
+                                dir = root.open_directory(path)
                         if "properties" in change:
                             for prop, value in change["properties"].items():
                                 dir.change_prop(prop, value)
                         dir.close()
                     else:
-                        try:
-                            file = root.add_file(path, copyfrom_path, copyfrom_rev)
-                        except SubversionException:
-                            file = root.open_file(path)
+                        if known_path:
+                            try:
+                                file = root.open_file(path)
+                            except SubversionException:
+                                file = root.add_file(path, copyfrom_path, copyfrom_rev)
+                        else:
+                            try:
+                                file = root.add_file(path, copyfrom_path, copyfrom_rev)
+                            except SubversionException:
+                                file = root.open_file(path)
                         if "properties" in change:
                             for prop, value in change["properties"].items():
                                 file.change_prop(prop, value)
@@ -76,6 +170,8 @@ def add_commit(
                         file.close()
     root.close()
     editor.close()
+    if _commit_session is not None:
+        _commit_session.known_paths[repo_url] = known_paths
 
     if date is not None:
         conn.change_rev_prop(
@@ -98,3 +194,125 @@ def create_repo(tmp_path, repo_name="tmprepo"):
             hook.write(b"#!/bin/sh\n\nexit 0")
         os.chmod(hook_file, 0o775)
     return f"file://{repo_path}"
+
+
+def copy_repo(template_repo_path: str, tmp_path, repo_name="tmprepo") -> str:
+    """Copy an empty repository created by :func:`create_repo`, which is cheaper
+    than creating a new one, and give the copy its own uuid."""
+    repo_path = os.path.join(tmp_path, repo_name)
+    shutil.copytree(template_repo_path, repo_path)
+    # same layout as written by svnadmin setuuid: repository uuid followed,
+    # depending on the FSFS format, by the filesystem instance id
+    uuid_path = os.path.join(repo_path, "db", "uuid")
+    with open(uuid_path) as uuid_file:
+        nb_ids = len(uuid_file.read().splitlines())
+    with open(f"{uuid_path}.tmp", "w") as uuid_file:
+        uuid_file.write("".join(f"{uuid.uuid4()}\n" for _ in range(nb_ids)))
+    shutil.copymode(uuid_path, f"{uuid_path}.tmp")
+    os.replace(f"{uuid_path}.tmp", uuid_path)
+    return f"file://{repo_path}"
+
+
+def archive_digest(archive_path: str) -> str:
+    stat = os.stat(archive_path)
+    return _archive_digest(archive_path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=None)
+def _archive_digest(archive_path: str, mtime_ns: int, size: int) -> str:
+    hasher = hashlib.blake2b()
+    with open(archive_path, "rb") as archive:
+        for chunk in iter(lambda: archive.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()[:16]
+
+
+# larger reads than tarfile defaults (10KiB) when decompressing archives
+EXTRACT_BUFFER_SIZE = 1024 * 1024
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def extract_archive(archive_path: str, extract_dir: str) -> None:
+    """Extract a possibly gzip compressed tarball in a single streaming pass,
+    without spawning a tar process and using ISA-L inflate when available."""
+    with open(archive_path, "rb", buffering=EXTRACT_BUFFER_SIZE) as archive_file:
+        stream: BinaryIO = archive_file
+        # some test archives are plain tarballs despite their .tgz extension
+        if archive_file.peek(2)[:2] == GZIP_MAGIC:
+            stream = gzip.open(archive_file)
+        with tarfile.open(
+            fileobj=stream, mode="r|", bufsize=EXTRACT_BUFFER_SIZE
+        ) as archive:
+            if hasattr(tarfile, "fully_trusted_filter"):
+                # test archives are trusted and hold svn repositories as is
+                archive.extractall(extract_dir, filter="fully_trusted")
+            else:
+                archive.extractall(extract_dir)
+
+
+def link_or_copy(src: str, dst: str) -> None:
+    # never write through a hard link shared with the extraction cache
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def link_revisions_or_copy(src: str, dst: str) -> None:
+    """Copy a file of a FSFS repository, hard linking the revision files that
+    subversion never modifies once written. Other files, as the current
+    revision, rep-cache.db, revision properties or locks, can be updated in place
+    so they are copied."""
+    if f"{os.sep}db{os.sep}revs{os.sep}" in src:
+        link_or_copy(src, dst)
+    else:
+        shutil.copy2(src, dst)
+
+
+def extract_cached_archive(archive_path: str, cache_dir: str) -> str:
+    """Extract an archive in a sub-directory of ``cache_dir`` keyed by its content
+    hash, unless already done.
+
+    Extraction happens in a staging directory atomically renamed afterwards so
+    concurrent test processes sharing ``cache_dir`` never see partial content.
+
+    Returns:
+        the directory holding the archive content
+    """
+    extract_dir = os.path.join(cache_dir, archive_digest(archive_path))
+    if not os.path.exists(extract_dir):
+        staging_dir = tempfile.mkdtemp(dir=cache_dir)
+        extract_archive(archive_path, staging_dir)
+        try:
+            os.rename(staging_dir, extract_dir)
+        except OSError:
+            # another process sharing the cache extracted the same archive first
+            shutil.rmtree(staging_dir)
+    return extract_dir
+
+
+def prepare_cached_repository_from_archive(
+    archive_path: str, filename: Optional[str], tmp_path, cache_dir: str
+) -> str:
+    """Same as :func:`swh.loader.tests.prepare_repository_from_archive` except
+    the archive is only extracted once in ``cache_dir``, see
+    :func:`extract_cached_archive`, and its content then copied into ``tmp_path``
+    with :func:`link_revisions_or_copy`. If ``filename`` is not provided, the top
+    level directory of the archive is used.
+
+    Returns:
+        the file URL of the repository
+    """
+    extract_dir = extract_cached_archive(archive_path, cache_dir)
+    if filename is None:
+        (filename,) = os.listdir(extract_dir)
+    shutil.copytree(
+        extract_dir,
+        str(tmp_path),
+        symlinks=True,
+        copy_function=link_revisions_or_copy,
+        dirs_exist_ok=True,
+    )
+    return f"file://{tmp_path}/{filename}"